@@ -7,9 +7,16 @@ What it does:
 - Parses supported files:
     - Unreal text exports: .t3d, .copy  (from your CodexDump exports)
     - JSON exports: .json
-    - CSV exports: .csv
+    - CSV exports: .csv  (decoded with `pyarrow.csv` when installed, csv module otherwise)
+  across a pool of worker processes (--workers, default: usable CPU count)
+- Streams large JSON exports record-by-record when `ijson` is installed (optional)
+- Encodes chunk files with `orjson` when installed (optional; stdlib json otherwise)
 - Writes chunked JSON under ./clean_data/datasets/<dataset_key>/<dataset_key>_###.json
   with each chunk capped to a target size (default: 20 MiB) so files fit GitHub limits.
+- Optionally (needs `pyarrow`) also writes one columnar file per dataset next to its chunks,
+  with columns id, src, data (struct of the dataset's property keys):
+    --parquet : <dataset_key>.parquet (zstd)
+    --arrow   : <dataset_key>.arrows  (Arrow IPC stream, string columns dictionary-encoded)
 - Writes ./clean_data/index.json describing datasets + chunk files.
 
 Recommended workflow:
@@ -20,17 +27,49 @@ Usage:
   python sanitize_chunked.py
   python sanitize_chunked.py --input "C:\\Users\\you\\AppData\\Local\\Bellwright\\Saved\\Exports\\CodexDump" --output "./clean_data" --cap-mib 20
 
+Optional native build (compiles the parse/clean path to C with mypyc):
+  pip install mypy
+  mypyc sanitize_chunked.py    # builds sanitize_chunked.*.so / .pyd next to this file
+  SANITIZE_NATIVE=1 python sanitize_chunked.py   # runs the compiled module (rebuild after edits)
+
 """
 
 import argparse
 import csv
+import functools
 import json
+import multiprocessing
 import os
+import queue
 import re
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import IO, Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import ijson  # type: ignore  # optional: streams large JSON exports instead of json.load
+except ImportError:
+    ijson = None  # type: ignore[assignment]
+
+try:
+    import orjson  # optional: C-speed encoding for chunk files
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import pyarrow as pa  # type: ignore  # optional: columnar output (--parquet/--arrow), fast CSV decoding
+    import pyarrow.csv as pa_csv  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:
+    pa = None
+    pa_csv = None
+    pq = None
 
 # -------------------------
 # Defaults / policy knobs
@@ -38,20 +77,27 @@ from typing import Any, Dict, List, Optional, Tuple
 
 DEFAULT_CAP_MIB = 20  # keep well under 25 MiB browser upload and 100 MiB git hard limit
 DATASETS_DIRNAME = "datasets"
+SUPPORTED_EXTS = {".t3d", ".copy", ".json", ".csv"}
+JSON_STREAM_MIN_BYTES = 16 * 1024 * 1024  # smaller JSON files are faster through json.load
+ARROW_BATCH_ROWS = 64 * 1024  # rows per record batch in .arrows streams
+CSV_BLOCK_SIZE = 16 * 1024 * 1024  # pyarrow.csv read block
+PARSE_CHUNKSIZE = 32  # files per worker task; amortizes pickling/IPC across small exports
+PARSE_TASKS_PER_WORKER = 2  # batches submitted ahead per worker; bounds parsed results held in memory
+RESULT_QUEUE_SIZE = 64  # parsed files buffered ahead of the chunk writer
 
 # Keys we generally don't want (engine/editor noise)
-BLACKLIST_KEYS = {
+BLACKLIST_KEYS = frozenset({
     "ExportPath", "UberGraphFrame", "Cooked",
     "ExternalData", "AssetImportData", "SoftObjectPath",
-}
+})
 
 # If True, shorten "/Game/.../Foo.Foo" -> "Foo" (pretty but can break joins)
 STRIP_UE_PATHS = False
-KEEP_FULL_FOR_KEYS = {
+KEEP_FULL_FOR_KEYS = frozenset({
     "Blueprint", "Item", "Items", "Icon", "StatusEffect", "StatusEffects",
     "ItemPath", "ItemClass", "TechTreeItem", "TechTreeItemPath", "Class",
     "DamageTypeModified", "DamageType", "WeaponType",
-}
+})
 
 # -------------------------
 # Batch alias mapping
@@ -86,6 +132,25 @@ BATCH_ALIAS = {
 
 EMPTY_SENTINELS = {None, "", "None"}  # do NOT treat 0 as empty
 
+def _dumps(obj: Any) -> bytes:
+    """Minified UTF-8 JSON (orjson when installed, stdlib json otherwise)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:  # e.g. ints beyond 64 bits; stdlib handles those
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _dumps_indented(obj: Any) -> bytes:
+    """2-space indented UTF-8 JSON for human-facing files like index.json."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+@functools.lru_cache(maxsize=4096)  # key names repeat across every record
 def should_keep_full_path(key_name: Optional[str]) -> bool:
     if not key_name:
         return False
@@ -94,62 +159,138 @@ def should_keep_full_path(key_name: Optional[str]) -> bool:
     k = key_name.lower()
     return k.endswith("path") or k.endswith("class")
 
-def clean_value(val: Any, key_name: Optional[str] = None) -> Any:
-    """Recursive cleaner. Drops junk keys. Keeps 0 values."""
-    if isinstance(val, dict):
-        # Unwrap common wrappers
-        if len(val) == 1:
-            k = next(iter(val.keys()))
-            if k in ("Key", "SourceString", "AssetPathName"):
-                return clean_value(val[k], key_name=key_name)
-
-        new: Dict[str, Any] = {}
-        for k, v in val.items():
-            if k in BLACKLIST_KEYS:
-                continue
-            cleaned = clean_value(v, key_name=k)
-            if cleaned in EMPTY_SENTINELS or cleaned == [] or cleaned == {}:
-                continue
-            new[k] = cleaned
-        return new if new else None
+# Repeated string values (UE paths, enum names, icons...) share one object.
+# sys.intern doesn't keep strings alive on its own, so unique values are still freed.
+_intern = sys.intern
 
-    if isinstance(val, list):
-        out = []
-        for x in val:
-            cleaned = clean_value(x, key_name=key_name)
-            if cleaned in EMPTY_SENTINELS or cleaned == [] or cleaned == {}:
-                continue
-            out.append(cleaned)
-        return out if out else None
+_UNWRAP_KEYS = ("Key", "SourceString", "AssetPathName")
+_NULL_STRINGS = ("None", "null", "NULL")
 
-    if isinstance(val, str):
-        s = val.strip()
-        if s in ("None", "null", "NULL"):
-            return None
+def _clean_str(s: str, key_name: Optional[str]) -> Optional[str]:
+    s = s.strip()
+    if s in _NULL_STRINGS:
+        return None
+    if STRIP_UE_PATHS and ("/Game/" in s or "/Engine/" in s) and not should_keep_full_path(key_name):
+        s = s.split(".")[-1].replace("'", "")
+    return _intern(s)
 
-        if ("/Game/" in s or "/Engine/" in s) and STRIP_UE_PATHS:
-            if should_keep_full_path(key_name):
-                return s
-            return s.split(".")[-1].replace("'", "")
+def clean_value(val: Any, key_name: Optional[str] = None) -> Any:
+    """
+    Cleaner for nested dict/list values. Drops junk keys. Keeps 0 values.
+
+    Walks with an explicit stack instead of recursing: scalar children are cleaned
+    inline and only nested containers get a frame, which keeps Python call overhead
+    off the (very wide, fairly shallow) UE property trees.
 
-        return s
+    >>> clean_value({"Props": {"Tags": ["a", "None", ""], "Stats": {"Hp": 0}}, "Empty": {}})
+    {'Props': {'Tags': ['a'], 'Stats': {'Hp': 0}}}
+    """
+    blacklisted = BLACKLIST_KEYS.__contains__
+    is_empty = EMPTY_SENTINELS.__contains__
+    unwrap_keys = _UNWRAP_KEYS
+    clean_str = _clean_str
+
+    # Frames: (out, items iterator, is_dict, key_name for list items, slot in parent)
+    stack: List[Tuple[Any, Iterator[Any], bool, Optional[str], Any]] = []
+    node, node_key, slot = val, key_name, None
+
+    while True:
+        # Enter node: unwrap single-key wrappers, push containers, clean leaves
+        while isinstance(node, dict) and len(node) == 1:
+            k = next(iter(node))
+            if k not in unwrap_keys:
+                break
+            node = node[k]
+
+        if isinstance(node, dict):
+            stack.append(({}, iter(node.items()), True, node_key, slot))
+            result = None
+            pending = False
+        elif isinstance(node, list):
+            stack.append(([], iter(node), False, node_key, slot))
+            result = None
+            pending = False
+        else:
+            result = _clean_str(node, node_key) if isinstance(node, str) else node
+            pending = True
+
+        # Attach finished results to their parents and advance to the next container child
+        while True:
+            if pending:
+                if not stack:
+                    return result
+                parent = stack[-1]
+                # Empty containers already came back as None, and _clean_str never returns "None"
+                if result is not None and result != "":
+                    if parent[2]:
+                        parent[0][slot] = result
+                    else:
+                        parent[0].append(result)
+                pending = False
+
+            out, it, is_dict, frame_key, frame_slot = stack[-1]
+            descend = False
+
+            if is_dict:
+                for k, v in it:
+                    if blacklisted(k):
+                        continue
+                    if isinstance(v, str):
+                        v = clean_str(v, k)
+                        if v:
+                            out[k] = v
+                    elif isinstance(v, (dict, list)):
+                        node, node_key, slot = v, k, k
+                        descend = True
+                        break
+                    elif not is_empty(v):
+                        out[k] = v
+            else:
+                for v in it:
+                    if isinstance(v, str):
+                        v = clean_str(v, frame_key)
+                        if v:
+                            out.append(v)
+                    elif isinstance(v, (dict, list)):
+                        node, node_key, slot = v, frame_key, None
+                        descend = True
+                        break
+                    elif not is_empty(v):
+                        out.append(v)
+
+            if descend:
+                break
 
-    return val
+            # Container exhausted: it becomes a result for its own parent
+            stack.pop()
+            result = out if out else None
+            slot = frame_slot
+            pending = True
 
 # -------------------------
 # UE text export parsing (.t3d / .copy)
 # -------------------------
 
 _re_key_index = re.compile(r"^(?P<base>.+)\((?P<idx>\d+)\)$")
-_re_int = re.compile(r"^-?\d+$")
-_re_float = re.compile(r"^-?\d+\.\d+$")
+_re_nsloctext_end = re.compile(r'NSLOCTEXT\([^)]*,"([^"]*)"\)\s*$')
+_re_nsloctext_any = re.compile(r'NSLOCTEXT\([^)]*,"([^"]*)"\)')
+
+# Key=Value lines, minus structural ones; same rules as the stripped-line checks in _iter_ue_lines
+_UE_SKIP_PREFIXES = ("Begin ", "End ", "CustomProperties", "ObjectArchetype=")
+_re_ue_property = re.compile(
+    r"^(?![^\S\n]*(?:Begin |End |CustomProperties|ObjectArchetype=))([^=\n]*)=(.*)$",
+    re.MULTILINE,
+)
+UE_SCAN_MAX_BYTES = 64 * 1024 * 1024  # larger exports are read line by line
 
 def _parse_loc_text(s: str) -> Optional[str]:
     # NSLOCTEXT("a","b","Display") -> Display
-    m = re.search(r'NSLOCTEXT\([^)]*,"([^"]*)"\)\s*$', s)
+    if "NSLOCTEXT(" not in s:
+        return None
+    m = _re_nsloctext_end.search(s)
     if m:
         return m.group(1)
-    m = re.search(r'NSLOCTEXT\([^)]*,"([^"]*)"\)', s)
+    m = _re_nsloctext_any.search(s)
     if m:
         return m.group(1)
     return None
@@ -168,30 +309,26 @@ def _scalar(v: str) -> Any:
     if v == "False":
         return False
 
-    if _re_int.match(v):
+    # Plain string checks instead of ^-?\d+$ / ^-?\d+\.\d+$ (isdecimal == \d)
+    digits = v[1:] if v.startswith("-") else v
+    if digits.isdecimal():
         try:
             return int(v)
-        except Exception:
-            pass
-    if _re_float.match(v):
-        try:
-            return float(v)
-        except Exception:
+        except ValueError:
             pass
+    whole, dot, frac = digits.partition(".")
+    if dot and whole.isdecimal() and frac.isdecimal():
+        return float(v)
 
-    loc = _parse_loc_text(v)
-    if loc is not None:
-        return loc
+    if "NSLOCTEXT(" in v:
+        loc = _parse_loc_text(v)
+        if loc is not None:
+            return _intern(loc)
 
-    return v
-
-def parse_ue_text_export(file_path: Path) -> Dict[str, Any]:
-    """
-    Parses UE text exports into a dict of properties.
-    Focuses on Key=Value and Key(index)=Value lines.
-    """
-    props: Dict[str, Any] = {}
+    return _intern(v)
 
+def _iter_ue_lines(file_path: Path) -> Iterator[Tuple[str, str]]:
+    """Line-by-line (key, value) reader; used for exports too large to scan in one go."""
     with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
         for raw_line in f:
             line = raw_line.strip()
@@ -199,126 +336,286 @@ def parse_ue_text_export(file_path: Path) -> Dict[str, Any]:
                 continue
 
             # Skip noisy structural lines
-            if line.startswith(("Begin ", "End ", "CustomProperties", "ObjectArchetype=")):
+            if line.startswith(_UE_SKIP_PREFIXES):
                 continue
 
             if "=" not in line:
                 continue
 
             key, value = line.split("=", 1)
-            key = key.strip()
-            value = value.strip()
-
-            m = _re_key_index.match(key)
-            if m:
-                base = m.group("base")
-                idx = int(m.group("idx"))
-                arr = props.get(base)
-                if not isinstance(arr, list):
-                    arr = []
-                    props[base] = arr
-                while len(arr) <= idx:
-                    arr.append(None)
-                arr[idx] = _scalar(value)
-                continue
+            yield key.strip(), value.strip()
+
+def _iter_ue_properties(file_path: Path) -> Iterator[Tuple[str, str]]:
+    """Yields stripped (key, value) pairs from Key=Value lines, skipping structural lines."""
+    if file_path.stat().st_size > UE_SCAN_MAX_BYTES:
+        yield from _iter_ue_lines(file_path)
+        return
+
+    # One regex pass over the whole file keeps the per-line loop inside the re engine
+    data = file_path.read_text(encoding="utf-8", errors="ignore")
+    for key, value in _re_ue_property.findall(data):
+        yield key.strip(), value.strip()
+
+def _clean_flat_props(props: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    clean_value specialized for the flat {key: scalar} dicts parse_ue_text_export
+    builds (the shape of nearly every export): same rules, no container dispatch.
+    """
+    blacklist = BLACKLIST_KEYS
+    clean_str = _clean_str
+
+    out: Dict[str, Any] = {}
+    for k, v in props.items():
+        if k in blacklist:
+            continue
+        if type(v) is str:
+            v = clean_str(v, k)
+            if v:
+                out[k] = v
+        else:
+            out[k] = v  # _scalar's int/float/bool are never empty
+    return out if out else None
+
+def parse_ue_text_export(file_path: Path) -> Dict[str, Any]:
+    """
+    Parses UE text exports into a dict of properties.
+    Focuses on Key=Value and Key(index)=Value lines.
+    """
+    return _ue_props(_iter_ue_properties(file_path))
+
+def _ue_props(pairs: Iterable[Tuple[str, str]]) -> Dict[str, Any]:
+    """
+    Cleaned properties from (key, value) pairs; Key(index) keys become lists.
+
+    >>> _ue_props([("Foo(0)", "a"), ("Foo(2)", "x"), ("Bar", "1")])
+    {'Foo': ['a', 'x'], 'Bar': 1}
+    """
+    props: Dict[str, Any] = {}
+
+    for key, value in pairs:
+        m = _re_key_index.match(key)
+        if m:
+            base = m.group("base")
+            # Collect {idx: value} and build the list once at the end; the dict also
+            # holds base's place in props (scalar values are never dicts)
+            slots = props.get(base)
+            if not isinstance(slots, dict):
+                slots = {}
+                props[base] = slots
+            slots[int(m.group("idx"))] = _scalar(value)
+            continue
 
-            props[key] = _scalar(value)
+        props[key] = _scalar(value)
 
-    cleaned = clean_value(props)
+    has_arrays = False
+    for key, slots in props.items():
+        if isinstance(slots, dict):
+            props[key] = [slots.get(i) for i in range(max(slots) + 1)]
+            has_arrays = True
+
+    if has_arrays or (len(props) == 1 and next(iter(props)) in _UNWRAP_KEYS):
+        cleaned = clean_value(props)
+    else:
+        cleaned = _clean_flat_props(props)
     return cleaned if isinstance(cleaned, dict) else {}
 
 # -------------------------
 # CSV / JSON processing
 # -------------------------
 
-def process_json(file_path: Path) -> List[Dict[str, Any]]:
+def _clean_json_row(row: Any) -> Any:
+    props = row.get("Properties", row) if isinstance(row, dict) else row
+    return clean_value(props)
+
+def _iter_json_list(rows: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+    for i, row in enumerate(rows, start=1):
+        cleaned = _clean_json_row(row)
+        if not cleaned:
+            continue
+        rid = None
+        if isinstance(row, dict):
+            rid = row.get("Name") or row.get("RowName")
+        if not rid:
+            rid = f"Row_{i}"
+        yield {"id": str(rid), "data": cleaned}
+
+def _iter_json_map(rows: Iterable[Tuple[str, Any]]) -> Iterator[Dict[str, Any]]:
+    for rid, row in rows:
+        cleaned = _clean_json_row(row)
+        if cleaned:
+            yield {"id": str(rid), "data": cleaned}
+
+def _json_stream_shape(file_path: Path) -> Optional[str]:
+    """
+    Streaming lookahead: "list" for a top-level array, "rows_map"/"rows_list" for
+    {"Rows": {...}} / {"Rows": [...]}, None for anything else.
+    """
+    with open(file_path, "rb") as f:
+        rows_next = False
+        try:
+            for prefix, event, value in ijson.parse(f):
+                if rows_next:
+                    return {"start_map": "rows_map", "start_array": "rows_list"}.get(event)
+                if prefix == "":
+                    if event == "start_array":
+                        return "list"
+                    if event == "map_key" and value == "Rows":
+                        rows_next = True
+                    elif event not in ("start_map", "map_key"):
+                        return None
+        except ijson.JSONError:
+            return None  # let json.load handle (or report) it
+    return None
+
+def _iter_json_loaded(file_path: Path) -> Iterator[Dict[str, Any]]:
+    """iter_json for a document read whole with json.load."""
     with open(file_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
-    records: List[Dict[str, Any]] = []
-
     if isinstance(data, list):
-        for i, row in enumerate(data, start=1):
-            props = row.get("Properties", row) if isinstance(row, dict) else row
-            cleaned = clean_value(props)
-            if not cleaned:
-                continue
-            rid = None
-            if isinstance(row, dict):
-                rid = row.get("Name") or row.get("RowName")
-            if not rid:
-                rid = f"Row_{i}"
-            records.append({"id": str(rid), "data": cleaned})
-        return records
+        yield from _iter_json_list(data)
+        return
 
     if isinstance(data, dict) and "Rows" in data:
         rows = data["Rows"]
         if isinstance(rows, dict):
-            for rid, row in rows.items():
-                props = row.get("Properties", row) if isinstance(row, dict) else row
-                cleaned = clean_value(props)
-                if cleaned:
-                    records.append({"id": str(rid), "data": cleaned})
-            return records
+            yield from _iter_json_map(rows.items())
+            return
 
         if isinstance(rows, list):
-            for i, row in enumerate(rows, start=1):
-                props = row.get("Properties", row) if isinstance(row, dict) else row
-                cleaned = clean_value(props)
-                if not cleaned:
-                    continue
-                rid = None
-                if isinstance(row, dict):
-                    rid = row.get("Name") or row.get("RowName")
-                if not rid:
-                    rid = f"Row_{i}"
-                records.append({"id": str(rid), "data": cleaned})
-            return records
+            yield from _iter_json_list(rows)
+            return
 
     cleaned = clean_value(data)
     if cleaned:
-        records.append({"id": "__root__", "data": cleaned})
-    return records
+        yield {"id": "__root__", "data": cleaned}
+
+def _unique_keys(items: Iterable[Tuple[str, Any]]) -> Iterator[Tuple[str, Any]]:
+    # json.load keeps only the last of duplicate keys; ijson.kvitems yields them all
+    seen = set()
+    for key, value in items:
+        if key in seen:
+            raise ValueError(f"duplicate Rows key {key!r}")
+        seen.add(key)
+        yield key, value
+
+def _json_stream_plan(file_path: Path) -> Optional[str]:
+    """
+    The shape a JSON export will be streamed as (see _json_stream_shape), or None when
+    it goes through json.load: not .json, under JSON_STREAM_MIN_BYTES, no ijson, or a
+    shape ijson can't stream.
+    """
+    if ijson is None or file_path.suffix.lower() != ".json":
+        return None
+    try:
+        if file_path.stat().st_size < JSON_STREAM_MIN_BYTES:
+            return None
+        return _json_stream_shape(file_path)
+    except OSError:
+        return None  # let parse_file report it
+
+def iter_json(file_path: Path, shape: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yields {"id", "data"} records from a JSON export.
+    With a shape from _json_stream_plan the file is streamed with ijson, so the raw
+    document is never held in memory; otherwise it goes through json.load.
+
+    A streamed file raises wherever it stops matching json.load (malformed JSON, the
+    yajl2_c backend's "integer overflow" on ints wider than 64 bits, duplicate Rows
+    keys); ResultWriter then drops its records and parses it whole with parse_file.
+    """
+    if shape is None:
+        yield from _iter_json_loaded(file_path)
+        return
+
+    with open(file_path, "rb") as f:
+        if shape == "rows_map":
+            yield from _iter_json_map(_unique_keys(ijson.kvitems(f, "Rows", use_float=True)))
+        else:
+            prefix = "item" if shape == "list" else "Rows.item"
+            yield from _iter_json_list(ijson.items(f, prefix, use_float=True))
+
+def _universal_newlines(values: List[str]) -> List[str]:
+    # pyarrow keeps quoted line breaks as raw bytes; DictReader (text mode) saw "\n"
+    return [v.replace("\r\n", "\n").replace("\r", "\n") if "\r" in v else v for v in values]
+
+def _read_csv_arrow(file_path: Path) -> Optional[Tuple[List[str], List[Dict[str, Any]]]]:
+    """
+    Decodes a CSV with pyarrow.csv (C parser), every column kept as a string exactly
+    like csv.DictReader would, line breaks in quoted cells included. Returns
+    (fieldnames, rows), or None when pyarrow isn't installed or the file needs
+    DictReader's leniency (ragged rows, duplicate, missing or multi-line header).
+    """
+    if pa_csv is None:
+        return None
+
+    with open(file_path, "r", encoding="utf-8-sig", newline="") as f:
+        header = next(csv.reader(f), None)
+    if not header or len(set(header)) != len(header) or any("\n" in name or "\r" in name for name in header):
+        return None
+
+    try:
+        tbl = pa_csv.read_csv(
+            file_path,
+            # No pyarrow thread pool: this already runs in one of N pool workers
+            read_options=pa_csv.ReadOptions(
+                column_names=header, skip_rows=1, block_size=CSV_BLOCK_SIZE, use_threads=False,
+            ),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                strings_can_be_null=False,
+            ),
+        )
+    except pa.ArrowException:
+        return None
+
+    columns = [_universal_newlines(col.to_pylist()) for col in tbl.columns]
+    return header, [dict(zip(header, values)) for values in zip(*columns)]
+
+def _iter_csv_records(first_col: Optional[str], rows: Iterable[Dict[Any, Any]]) -> Iterator[Dict[str, Any]]:
+    for idx, row in enumerate(rows, start=1):
+        if not row:
+            continue
+        rid = (
+            row.get("Name") or row.get("RowName") or row.get("ID") or row.get("Id")
+            or (first_col and row.get(first_col))
+            or f"Row_{idx}"
+        )
+        cleaned_row: Dict[str, Any] = {}
+        for k, v in row.items():
+            if k is None:
+                continue
+            cleaned = clean_value(v, key_name=k)
+            if cleaned in EMPTY_SENTINELS or cleaned == [] or cleaned == {}:
+                continue
+            cleaned_row[k] = cleaned
+        if cleaned_row:
+            yield {"id": str(rid), "data": cleaned_row}
 
 def process_csv(file_path: Path) -> List[Dict[str, Any]]:
-    records: List[Dict[str, Any]] = []
+    decoded = _read_csv_arrow(file_path)
+    if decoded is not None:
+        fieldnames, rows = decoded
+        return list(_iter_csv_records(fieldnames[0], rows))
+
     with open(file_path, "r", encoding="utf-8-sig") as f:
         reader = csv.DictReader(f)
-        for idx, row in enumerate(reader, start=1):
-            if not row:
-                continue
-            rid = (
-                row.get("Name") or row.get("RowName") or row.get("ID") or row.get("Id")
-                or (reader.fieldnames[0] and row.get(reader.fieldnames[0]))
-                or f"Row_{idx}"
-            )
-            cleaned_row: Dict[str, Any] = {}
-            for k, v in row.items():
-                if k is None:
-                    continue
-                cleaned = clean_value(v, key_name=k)
-                if cleaned in EMPTY_SENTINELS or cleaned == [] or cleaned == {}:
-                    continue
-                cleaned_row[k] = cleaned
-            if cleaned_row:
-                records.append({"id": str(rid), "data": cleaned_row})
-    return records
+        first_col = reader.fieldnames[0] if reader.fieldnames else None
+        return list(_iter_csv_records(first_col, reader))
 
 # -------------------------
 # Dataset key derivation
 # -------------------------
 
-def derive_dataset_key(input_root: Path, file_path: Path) -> Tuple[str, str, str]:
-    """
-    Returns (dataset_key, kind, record_id_prefix).
+_re_batch = re.compile(r"^\d{2}_")
 
-    dataset_key: e.g. "items_cdo", "traits_assets"
-    kind: "assets" | "cdo" | "misc"
-    record_id_prefix: path prefix used to create stable ids
+@functools.lru_cache(maxsize=4096)  # sibling files share their leading parts
+def _derive_prefix(parts: Tuple[str, ...]) -> Tuple[str, str, int]:
+    """
+    Returns (dataset_key, kind, start_idx) from the leading relative path parts.
+    Only parts[:3] are ever inspected, so callers pass at most that many.
     """
-    rel = file_path.relative_to(input_root)
-    parts = rel.parts
-
     # Detect if inputs are nested like raw_dump/CodexDump/<batch>/<assets|cdo>/...
     batch = None
     kind = "misc"
@@ -330,7 +627,7 @@ def derive_dataset_key(input_root: Path, file_path: Path) -> Tuple[str, str, str
 
     # If the first part looks like "01_traits", treat it as batch
     cand = parts[start_idx] if len(parts) > start_idx else None
-    if cand and re.match(r"^\d{2}_", cand):
+    if cand and _re_batch.match(cand):
         batch = cand
         start_idx += 1
 
@@ -340,9 +637,23 @@ def derive_dataset_key(input_root: Path, file_path: Path) -> Tuple[str, str, str
             kind = parts[start_idx]
             start_idx += 1
 
-    alias = BATCH_ALIAS.get(batch, batch or "misc")
+    alias = BATCH_ALIAS.get(batch, batch) if batch else "misc"
 
     dataset_key = f"{alias}_{kind}" if kind in ("assets", "cdo") else alias
+    return dataset_key, kind, start_idx
+
+def derive_dataset_key(input_root: Path, file_path: Path) -> Tuple[str, str, str]:
+    """
+    Returns (dataset_key, kind, record_id_prefix).
+
+    dataset_key: e.g. "items_cdo", "traits_assets"
+    kind: "assets" | "cdo" | "misc"
+    record_id_prefix: path prefix used to create stable ids
+    """
+    rel = file_path.relative_to(input_root)
+    parts = rel.parts
+
+    dataset_key, kind, start_idx = _derive_prefix(parts[:3])
 
     # record_id_prefix = remaining path without extension
     remaining = Path(*parts[start_idx:]) if len(parts) > start_idx else Path(file_path.stem)
@@ -354,70 +665,501 @@ def derive_dataset_key(input_root: Path, file_path: Path) -> Tuple[str, str, str
 # Chunk writer
 # -------------------------
 
+CHUNK_WRITE_BUFFER = 1 << 20  # 1 MiB
+
+ChunkMark = Tuple[int, int, int, int, int]  # len(chunks), chunk_index, records, approx_bytes, bytes_written
+
 @dataclass
 class ChunkState:
     dataset_key: str
     cap_bytes: int
     out_dir: Path
     chunk_index: int = 0
-    records: List[Dict[str, Any]] = field(default_factory=list)
+    records: int = 0  # records written to the open chunk
     approx_bytes: int = 2  # for []
-
-    def _chunk_path(self) -> Path:
-        return self.out_dir / f"{self.dataset_key}_{self.chunk_index:03d}.json"
+    bytes_written: int = 0
+    chunks: List[Dict[str, Any]] = field(default_factory=list)  # info for each closed chunk
+    fh: Optional[IO[bytes]] = field(default=None, repr=False)
+    last_src: Optional[str] = field(default=None, repr=False)
+    last_src_json: bytes = field(default=b"", repr=False)
+
+    def _chunk_path(self, chunk_index: Optional[int] = None) -> Path:
+        if chunk_index is None:
+            chunk_index = self.chunk_index
+        return self.out_dir / f"{self.dataset_key}_{chunk_index:03d}.json"
+
+    def _write(self, data: bytes) -> None:
+        assert self.fh is not None
+        self.fh.write(data)
+        self.bytes_written += len(data)
+
+    def _encode_record(self, rec: Dict[str, Any]) -> bytes:
+        # Same bytes as _dumps(rec), but src is shared by every record of a file
+        # (they arrive back to back), so it is encoded once per file, not per record
+        src = rec["src"]
+        if src is not self.last_src:
+            self.last_src = src
+            self.last_src_json = _dumps(src)
+        return b'{"id":' + _dumps(rec["id"]) + b',"src":' + self.last_src_json + b',"data":' + _dumps(rec["data"]) + b"}"
 
     def add_record(self, rec: Dict[str, Any]) -> None:
-        # Estimate bytes if we add this record
-        rec_bytes = len(json.dumps(rec, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        blob = self._encode_record(rec)
         # +1 for comma
-        projected = self.approx_bytes + rec_bytes + 1
+        projected = self.approx_bytes + len(blob) + 1
 
         if self.records and projected > self.cap_bytes:
             self.flush()
 
-        self.records.append(rec)
-        self.approx_bytes = self.approx_bytes + rec_bytes + 1
+        if self.fh is None:
+            out_path = self._chunk_path()
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            self.fh = open(out_path, "wb", buffering=CHUNK_WRITE_BUFFER)
+            self._write(b'{"dataset":' + _dumps(self.dataset_key) + b',"chunk":' + _dumps(self.chunk_index) + b',"records":[')
+
+        # Minified JSON, streamed record by record so a chunk is never held in memory
+        if self.records:
+            self._write(b",")
+        self._write(blob)
+        self.records += 1
+        self.approx_bytes = self.approx_bytes + len(blob) + 1
 
     def flush(self) -> Optional[Dict[str, Any]]:
-        if not self.records:
+        """Closes the open chunk file; returns its info (also kept in self.chunks)."""
+        if self.fh is None:
             return None
 
-        out_path = self._chunk_path()
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-
-        payload = {
-            "dataset": self.dataset_key,
-            "chunk": self.chunk_index,
-            "records": self.records,
-        }
-
-        # Minified JSON for size
-        raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
-        out_path.write_bytes(raw)
+        self._write(b"]}")
+        self.fh.close()
 
         info = {
-            "file": str(out_path.as_posix()),
-            "records": len(self.records),
-            "bytes": len(raw),
+            "file": str(self._chunk_path().as_posix()),
+            "records": self.records,
+            "bytes": self.bytes_written,
             "chunk": self.chunk_index,
         }
+        self.chunks.append(info)
 
         # Advance
         self.chunk_index += 1
-        self.records = []
+        self.records = 0
         self.approx_bytes = 2
+        self.bytes_written = 0
+        self.fh = None
 
         return info
 
+    def mark(self) -> ChunkMark:
+        """Position to rewind() back to, e.g. before a streamed file's records."""
+        return len(self.chunks), self.chunk_index, self.records, self.approx_bytes, self.bytes_written
+
+    def rewind(self, mark: ChunkMark) -> None:
+        """Drops every record added since mark, including chunks opened after it."""
+        n_chunks, chunk_index, records, approx_bytes, bytes_written = mark
+        if self.fh is not None:
+            self.fh.close()
+            self.fh = None
+        for idx in range(chunk_index + 1, self.chunk_index + 1):
+            self._chunk_path(idx).unlink(missing_ok=True)
+        del self.chunks[n_chunks:]
+
+        self.chunk_index = chunk_index
+        self.records = records
+        self.approx_bytes = approx_bytes
+        self.bytes_written = bytes_written
+        if records:
+            # Reopen the chunk that was open at mark and cut it back (drops a "]}" too)
+            self.fh = open(self._chunk_path(), "r+b", buffering=CHUNK_WRITE_BUFFER)
+            self.fh.truncate(bytes_written)
+            self.fh.seek(bytes_written)
+        else:
+            self._chunk_path().unlink(missing_ok=True)
+
+    def discard(self) -> None:
+        """Closes and deletes the open (unterminated) chunk file, if any."""
+        if self.fh is None:
+            return
+        self.fh.close()
+        self.fh = None
+        self._chunk_path().unlink(missing_ok=True)
+
+# -------------------------
+# Columnar writer (optional, needs pyarrow)
+# -------------------------
+
+def _arrow_array(values: List[Any], dictionary_strings: bool = False) -> Any:
+    """
+    Lets pyarrow infer the column type; mixed-type columns fall back to strings
+    (non-strings as JSON). String columns are optionally dictionary-encoded.
+    """
+    try:
+        arr = pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, OverflowError):
+        arr = pa.array(
+            [v if v is None or isinstance(v, str) else _dumps(v).decode("utf-8") for v in values],
+            type=pa.string(),
+        )
+    if dictionary_strings and pa.types.is_string(arr.type):
+        arr = arr.dictionary_encode()  # int32 indices; UE paths/enums repeat heavily
+    return arr
+
+def _arrow_schema_info(schema: Any) -> Dict[str, str]:
+    """{"id": "string", ..., "data.<key>": "<type>"} for index.json."""
+    out: Dict[str, str] = {}
+    for f in schema:
+        if f.name == "data" and pa.types.is_struct(f.type):
+            for child in f.type:
+                out[f"data.{child.name}"] = str(child.type)
+        else:
+            out[f.name] = str(f.type)
+    return out
+
+@dataclass
+class TableState:
+    """
+    Buffers a whole dataset column-wise (one list per property key) so it can be
+    written as a columnar file with a single schema.
+    """
+    dataset_key: str
+    out_dir: Path
+    rows: int = 0
+    ids: List[str] = field(default_factory=list)
+    srcs: List[str] = field(default_factory=list)
+    columns: Dict[str, List[Any]] = field(default_factory=dict)  # data key -> values (None-padded)
+    non_dict: Dict[int, Any] = field(default_factory=dict)  # row -> data, for records whose data isn't a dict
+
+    def add_record(self, rec: Dict[str, Any]) -> None:
+        self.ids.append(rec["id"])
+        self.srcs.append(rec["src"])
+        data = rec["data"]
+        if isinstance(data, dict):
+            for k, v in data.items():
+                col = self.columns.get(k)
+                if col is None:
+                    col = self.columns[k] = []
+                if len(col) < self.rows:
+                    col.extend([None] * (self.rows - len(col)))
+                col.append(v)
+        else:
+            self.non_dict[self.rows] = data
+        self.rows += 1
+
+    def truncate(self, rows: int) -> None:
+        """Drops rows from index rows on (see ChunkState.rewind)."""
+        del self.ids[rows:]
+        del self.srcs[rows:]
+        for k in list(self.columns):
+            col = self.columns[k]
+            del col[rows:]
+            if not col:  # first seen after rows
+                del self.columns[k]
+        for row in [r for r in self.non_dict if r >= rows]:
+            del self.non_dict[row]
+        self.rows = rows
+
+    def _table(self, dictionary_strings: bool) -> Any:
+        """Table(id, src, data): data is a struct over the property keys (first-seen order)."""
+        for col in self.columns.values():
+            if len(col) < self.rows:
+                col.extend([None] * (self.rows - len(col)))
+
+        if not self.non_dict:
+            data = pa.StructArray.from_arrays(
+                [_arrow_array(col, dictionary_strings) for col in self.columns.values()],
+                names=list(self.columns),
+            )
+        else:
+            # Some records aren't dicts (e.g. scalar rows in a JSON list): one plain column
+            values = [
+                self.non_dict[i] if i in self.non_dict
+                else {k: col[i] for k, col in self.columns.items() if col[i] is not None}
+                for i in range(self.rows)
+            ]
+            data = _arrow_array(values, dictionary_strings)
+
+        return pa.Table.from_arrays(
+            [pa.array(self.ids, type=pa.string()), _arrow_array(self.srcs, dictionary_strings), data],
+            names=["id", "src", "data"],
+        )
+
+    def _info(self, out_path: Path) -> Dict[str, Any]:
+        return {
+            "file": str(out_path.as_posix()),
+            "records": self.rows,
+            "bytes": out_path.stat().st_size,
+        }
+
+    def write_parquet(self) -> Optional[Dict[str, Any]]:
+        if not self.rows:
+            return None
+
+        out_path = self.out_dir / f"{self.dataset_key}.parquet"
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        # Parquet dictionary-encodes repeated strings on its own
+        pq.write_table(self._table(dictionary_strings=False), out_path, compression="zstd")
+        return self._info(out_path)
+
+    def write_arrow(self) -> Optional[Dict[str, Any]]:
+        """Arrow IPC streaming format, string columns dictionary-encoded."""
+        if not self.rows:
+            return None
+
+        out_path = self.out_dir / f"{self.dataset_key}.arrows"
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        table = self._table(dictionary_strings=True)
+        with pa.ipc.new_stream(str(out_path), table.schema) as writer:
+            writer.write_table(table, max_chunksize=ARROW_BATCH_ROWS)
+
+        info = self._info(out_path)
+        info["schema"] = _arrow_schema_info(table.schema)
+        return info
+
+# -------------------------
+# Input discovery
+# -------------------------
+
+def iter_input_files(root: Path) -> Iterator[Path]:
+    """
+    Yields supported files under root, in the same order as root.rglob("*").
+    Filters on the scandir entry name so unrelated files never become Path objects.
+    """
+    stack = [str(root)]
+    while stack:
+        subdirs: List[str] = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTS and entry.is_file():
+                        yield Path(entry.path)
+        except PermissionError:
+            continue
+        # Depth-first, siblings in scandir order
+        stack.extend(reversed(subdirs))
+
+# -------------------------
+# Per-file parsing (runs in worker processes)
+# -------------------------
+
+ParseResult = Tuple[str, str, Iterable[Dict[str, Any]], Optional[str]]
+
+def _iter_file_records(
+    file_path: Path, rec_prefix: str, src: str, json_shape: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yields the complete ({"id", "src", "data"}) records of one export."""
+    ext = file_path.suffix.lower()
+    if ext in (".t3d", ".copy"):
+        parsed = parse_ue_text_export(file_path)
+        if parsed:
+            yield {"id": rec_prefix, "src": src, "data": parsed}
+
+    elif ext == ".json":
+        for r in iter_json(file_path, json_shape):
+            yield {"id": f"{rec_prefix}::{r['id']}", "src": src, "data": r["data"]}
+
+    elif ext == ".csv":
+        for r in process_csv(file_path):
+            yield {"id": f"{rec_prefix}::{r['id']}", "src": src, "data": r["data"]}
+
+def parse_file(file_path: Path, input_root: Path) -> ParseResult:
+    """
+    Parses one export into (dataset_key, kind, records, error).
+
+    Top-level so it can be pickled into worker processes. Records are complete
+    ({"id", "src", "data"}) and ready for ChunkState.add_record on the main process.
+    Parse failures are returned as an error message instead of raised, so one bad
+    file doesn't take down the pool.
+    """
+    dataset_key, kind, rec_prefix = derive_dataset_key(input_root, file_path)
+    src = str(file_path.relative_to(input_root).as_posix())
+
+    try:
+        records = list(_iter_file_records(file_path, rec_prefix, src))
+    except Exception as e:
+        return dataset_key, kind, [], f"!! error parsing {file_path}: {e}"
+
+    return dataset_key, kind, records, None
+
+def parse_batch(paths: List[Path], input_root: Path) -> List[ParseResult]:
+    """parse_file over one batch of paths (the unit of work sent to a pool worker)."""
+    return [parse_file(p, input_root) for p in paths]
+
+class StreamAborted(Exception):
+    """A streamed file failed part way; ResultWriter re-parses it with parse_file."""
+
+    def __init__(self, file_path: Path, input_root: Path) -> None:
+        super().__init__(f"streaming {file_path} failed")
+        self.file_path = file_path
+        self.input_root = input_root
+
+def _records_or_abort(file_path: Path, input_root: Path, records: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    try:
+        yield from records
+    except Exception as e:
+        raise StreamAborted(file_path, input_root) from e
+
+def stream_file(file_path: Path, input_root: Path, shape: str) -> ParseResult:
+    """
+    Like parse_file, but records are a lazy iterator the writer consumes straight into
+    ChunkState, so a huge export is never materialized as a list (or pickled across
+    processes). A parse error surfaces as StreamAborted, and ResultWriter discards
+    the file's records and re-parses it whole, so the outcome matches a pooled file.
+    """
+    dataset_key, kind, rec_prefix = derive_dataset_key(input_root, file_path)
+    src = str(file_path.relative_to(input_root).as_posix())
+    return dataset_key, kind, _records_or_abort(file_path, input_root, _iter_file_records(file_path, rec_prefix, src, shape)), None
+
+def _default_workers() -> int:
+    """CPUs this process may actually run on (honours taskset/container affinity)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on Windows/macOS
+        return os.cpu_count() or 1
+
+def _work_units(paths: List[Path]) -> Iterator[Tuple[Optional[str], List[Path]]]:
+    """Splits paths, in order, into pool batches of up to PARSE_CHUNKSIZE files and
+    single JSON files that are streamed on the main process: (stream shape or None, paths)."""
+    batch: List[Path] = []
+    for p in paths:
+        shape = _json_stream_plan(p)
+        if shape is not None:
+            if batch:
+                yield None, batch
+                batch = []
+            yield shape, [p]
+        else:
+            batch.append(p)
+            if len(batch) >= PARSE_CHUNKSIZE:
+                yield None, batch
+                batch = []
+    if batch:
+        yield None, batch
+
+StreamUnit = Tuple[Path, str]  # (path, stream shape)
+
+def _unit_results(unit: Union["Future[List[ParseResult]]", StreamUnit], input_root: Path) -> List[ParseResult]:
+    """Results of one pending work unit: a pool batch's future, or a file to stream."""
+    if isinstance(unit, tuple):
+        return [stream_file(unit[0], input_root, unit[1])]
+    return unit.result()
+
+def _pool_context() -> Any:
+    """forkserver where available: the chunk-writer thread is already running when the
+    pool starts, and forking a multi-threaded process can deadlock (deprecated in 3.12)."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context()  # spawn on Windows/macOS
+
+def iter_parsed(paths: List[Path], input_root: Path, workers: int) -> Iterator[ParseResult]:
+    """
+    Yields parse results in input order, fanned out over a process pool when workers > 1.
+    JSON files that ijson will stream bypass the pool (see _json_stream_plan, stream_file).
+    """
+    if workers <= 1:
+        for p in paths:
+            shape = _json_stream_plan(p)
+            yield stream_file(p, input_root, shape) if shape is not None else parse_file(p, input_root)
+        return
+    # Submit batches through a bounded window rather than Executor.map, which queues every
+    # path up front and lets finished results pile up however slowly the writer drains them.
+    window = PARSE_TASKS_PER_WORKER * workers
+    pending: Deque[Union["Future[List[ParseResult]]", StreamUnit]] = deque()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as ex:
+        try:
+            for shape, unit_paths in _work_units(paths):
+                if len(pending) >= window:
+                    yield from _unit_results(pending.popleft(), input_root)
+                pending.append((unit_paths[0], shape) if shape is not None else ex.submit(parse_batch, unit_paths, input_root))
+            while pending:
+                yield from _unit_results(pending.popleft(), input_root)
+        finally:
+            for unit in pending:
+                if not isinstance(unit, tuple):
+                    unit.cancel()
+
+# -------------------------
+# Result writer (own thread, so chunk writes overlap with parsing)
+# -------------------------
+
+@dataclass
+class ResultWriter:
+    datasets_root: Path
+    cap_bytes: int
+    columnar: bool  # also buffer TableState for --parquet/--arrow
+    datasets: Dict[str, Any]  # index["datasets"]
+    states: Dict[str, ChunkState] = field(default_factory=dict)
+    tables: Dict[str, TableState] = field(default_factory=dict)
+    records_seen: int = 0
+    error: Optional[BaseException] = None
+
+    def add(self, result: ParseResult) -> None:
+        dataset_key, kind, recs, error = result
+
+        # init state
+        if dataset_key not in self.states:
+            out_dir = self.datasets_root / dataset_key
+            self.states[dataset_key] = ChunkState(dataset_key=dataset_key, cap_bytes=self.cap_bytes, out_dir=out_dir)
+            if self.columnar:
+                self.tables[dataset_key] = TableState(dataset_key=dataset_key, out_dir=out_dir)
+            self.datasets[dataset_key] = {
+                "chunks": [],
+                "records_total": 0,
+                "files_total": 0,
+                "source_kind": kind,
+            }
+
+        if error:
+            print(error)
+            return
+
+        # recs may be a one-shot iterator (stream_file): single pass, counted as we go
+        state = self.states[dataset_key]
+        table = self.tables[dataset_key] if self.columnar else None
+        mark = state.mark()
+        table_rows = table.rows if table is not None else 0
+        n = 0
+        try:
+            for rec in recs:
+                state.add_record(rec)
+                if table is not None:
+                    table.add_record(rec)
+                n += 1
+        except StreamAborted as e:
+            # Drop what the streamed file wrote and parse it whole instead, so it ends up
+            # exactly like a pooled file: all of json.load's records, or the error and none
+            state.rewind(mark)
+            if table is not None:
+                table.truncate(table_rows)
+            self.add(parse_file(e.file_path, e.input_root))
+            return
+        self.datasets[dataset_key]["records_total"] += n
+        self.records_seen += n
+
+    def run(self, results: "queue.Queue[Optional[ParseResult]]") -> None:
+        """Thread body: drains results until a None sentinel. After a failure it keeps
+        draining (so the producer never blocks on a full queue) and leaves it in self.error."""
+        while True:
+            result = results.get()
+            if result is None:
+                return
+            if self.error is None:
+                try:
+                    self.add(result)
+                except BaseException as e:
+                    self.error = e
+
 # -------------------------
 # Main
 # -------------------------
 
-def main():
+def main() -> None:
     ap = argparse.ArgumentParser()
     ap.add_argument("--input", default="./raw_dump", help="Input folder containing exports (raw_dump / CodexDump)")
     ap.add_argument("--output", default="./clean_data", help="Output folder for website-ready data")
     ap.add_argument("--cap-mib", type=int, default=DEFAULT_CAP_MIB, help="Max size per JSON file in MiB (default: 20)")
+    ap.add_argument("--parquet", action="store_true", help="Also write one Parquet file per dataset (needs pyarrow)")
+    ap.add_argument("--arrow", action="store_true", help="Also write one Arrow IPC stream (.arrows) per dataset (needs pyarrow)")
+    ap.add_argument("--workers", type=int, default=_default_workers(), help="Parser processes (default: usable CPUs; 1 = no pool)")
     args = ap.parse_args()
 
     input_root = Path(args.input).expanduser().resolve()
@@ -426,6 +1168,8 @@ def main():
 
     if not input_root.exists():
         raise SystemExit(f"Input folder not found: {input_root}")
+    if (args.parquet or args.arrow) and pa is None:
+        raise SystemExit("--parquet/--arrow need pyarrow (pip install pyarrow)")
 
     # Output structure
     datasets_root = output_root / DATASETS_DIRNAME
@@ -435,9 +1179,10 @@ def main():
     print("Input :", input_root)
     print("Output:", output_root)
     print("Cap   :", args.cap_mib, "MiB per file")
+    print("Workers:", args.workers)
+    print("Build :", Path(__file__).name)
     print()
 
-    states: Dict[str, ChunkState] = {}
     index: Dict[str, Any] = {
         "schema_version": 1,
         "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -445,89 +1190,44 @@ def main():
         "datasets": {}
     }
 
-    # Walk input recursively
-    supported_exts = {".t3d", ".copy", ".json", ".csv"}
-
-    files_seen = 0
-    records_seen = 0
-
-    for p in input_root.rglob("*"):
-        if not p.is_file():
-            continue
-        if p.suffix.lower() not in supported_exts:
-            continue
-
-        files_seen += 1
-        dataset_key, kind, rec_prefix = derive_dataset_key(input_root, p)
-
-        # init state
-        if dataset_key not in states:
-            out_dir = datasets_root / dataset_key
-            states[dataset_key] = ChunkState(dataset_key=dataset_key, cap_bytes=cap_bytes, out_dir=out_dir)
-            index["datasets"][dataset_key] = {
-                "chunks": [],
-                "records_total": 0,
-                "files_total": 0,
-                "source_kind": kind,
-            }
+    # Walk input recursively; parse in worker processes, write chunks on a writer thread
+    paths = list(iter_input_files(input_root))
 
-        state = states[dataset_key]
+    files_seen = len(paths)
 
-        try:
-            ext = p.suffix.lower()
-            if ext in (".t3d", ".copy"):
-                parsed = parse_ue_text_export(p)
-                if not parsed:
-                    continue
-                rec = {
-                    "id": rec_prefix,
-                    "src": str(p.relative_to(input_root).as_posix()),
-                    "data": parsed,
-                }
-                state.add_record(rec)
-                index["datasets"][dataset_key]["records_total"] += 1
-                records_seen += 1
-
-            elif ext == ".json":
-                recs = process_json(p)
-                if not recs:
-                    continue
-                for r in recs:
-                    rec = {
-                        "id": f"{rec_prefix}::{r['id']}",
-                        "src": str(p.relative_to(input_root).as_posix()),
-                        "data": r["data"],
-                    }
-                    state.add_record(rec)
-                    index["datasets"][dataset_key]["records_total"] += 1
-                    records_seen += 1
-
-            elif ext == ".csv":
-                recs = process_csv(p)
-                if not recs:
-                    continue
-                for r in recs:
-                    rec = {
-                        "id": f"{rec_prefix}::{r['id']}",
-                        "src": str(p.relative_to(input_root).as_posix()),
-                        "data": r["data"],
-                    }
-                    state.add_record(rec)
-                    index["datasets"][dataset_key]["records_total"] += 1
-                    records_seen += 1
-
-        except Exception as e:
-            print(f"!! error parsing {p}: {e}")
-            continue
-
-    # Flush all remaining chunks and populate index
+    writer = ResultWriter(
+        datasets_root=datasets_root,
+        cap_bytes=cap_bytes,
+        columnar=args.parquet or args.arrow,
+        datasets=index["datasets"],
+    )
+    results: "queue.Queue[Optional[ParseResult]]" = queue.Queue(maxsize=RESULT_QUEUE_SIZE)
+    writer_thread = threading.Thread(target=writer.run, args=(results,), name="chunk-writer")
+    writer_thread.start()
+    try:
+        for result in iter_parsed(paths, input_root, args.workers):
+            if writer.error is not None:
+                break  # no point parsing the rest
+            results.put(result)
+    finally:
+        results.put(None)
+        writer_thread.join()
+    if writer.error is not None:
+        # Don't leave half-written chunks (no closing "]}") behind
+        for state in writer.states.values():
+            state.discard()
+        raise writer.error
+
+    states = writer.states
+    tables = writer.tables
+    records_seen = writer.records_seen
+
+    # Close the last chunk of each dataset and populate index
     for key, state in states.items():
         ds = index["datasets"][key]
+        state.flush()
         flushed: List[Dict[str, Any]] = []
-        while True:
-            info = state.flush()
-            if not info:
-                break
+        for info in state.chunks:
             # store relative path (from clean_data)
             rel_file = str(Path(info["file"]).relative_to(output_root).as_posix())
             info["file"] = rel_file
@@ -536,12 +1236,20 @@ def main():
         ds["chunks"] = flushed
         ds["files_total"] = len(flushed)
 
+        table = tables.get(key)
+        if table is not None:
+            columnar = {
+                "parquet": table.write_parquet() if args.parquet else None,
+                "arrow": table.write_arrow() if args.arrow else None,
+            }
+            for fmt, col_info in columnar.items():
+                if col_info:
+                    col_info["file"] = str(Path(col_info["file"]).relative_to(output_root).as_posix())
+                    ds[fmt] = col_info
+
     # Write index.json
     output_root.mkdir(parents=True, exist_ok=True)
-    (output_root / "index.json").write_text(
-        json.dumps(index, ensure_ascii=False, indent=2),
-        encoding="utf-8"
-    )
+    (output_root / "index.json").write_bytes(_dumps_indented(index))
 
     print("Files seen   :", files_seen)
     print("Records seen :", records_seen)
@@ -553,5 +1261,25 @@ def main():
     print("- Commit ./clean_data (not raw_dump) to GitHub Pages.")
     print("- In your site JS, load clean_data/index.json then fetch chunk files as needed.")
 
+def _native_main() -> Callable[[], None]:
+    """
+    main() from a mypyc build next to this file (opt-in via SANITIZE_NATIVE=1), so the
+    workers unpickle the compiled parse_file too. Falls back to this source if no build
+    is found, and warns when the build is older than the source it was compiled from.
+    """
+    import importlib
+    from importlib.machinery import EXTENSION_SUFFIXES
+
+    here = Path(__file__).resolve()
+    builds = [here.with_name(here.stem + suffix) for suffix in EXTENSION_SUFFIXES]
+    build = next((b for b in builds if b.is_file()), None)
+    if build is None:
+        print(f"!! SANITIZE_NATIVE=1 but no compiled build next to {here.name}; running the source")
+        return main
+    if build.stat().st_mtime < here.stat().st_mtime:
+        print(f"!! {build.name} is older than {here.name}; rebuild it with mypyc")
+    return importlib.import_module(here.stem).main
+
 if __name__ == "__main__":
-    main()
+    # The compiled build only runs when asked for, so a stale .so can't silently stand in for edits here.
+    (_native_main() if os.environ.get("SANITIZE_NATIVE") == "1" else main)()